@@ -2,6 +2,7 @@
 If executed from command-line, then `main()` is the entrypoint.
 """
 
+import logging
 import os
 from .common_fs import CACHE_PATH
 from .common_fs.file_filter import FileFilter
@@ -54,24 +55,26 @@ def main():
         # for PR reviews, we need this info
         if is_pr_event and (args.tidy_review or args.format_review):
             # get file changes from diff
+            files_by_name = {file.name: file for file in files}
             git_changes = rest_api_client.get_list_of_changed_files(
                 file_filter=global_file_filter,
                 lines_changed_only=0,  # prevent filtering out unchanged files
+                # skip changed files that are not in the list of all files
+                keep_names=set(files_by_name),
             )
             # merge info from git changes into list of all files
             for git_file in git_changes:
-                for file in files:
-                    if git_file.name == file.name:
-                        file.additions = git_file.additions
-                        file.diff_chunks = git_file.diff_chunks
-                        file.lines_added = git_file.lines_added
-                        break
+                file = files_by_name.get(git_file.name)
+                if file is not None:
+                    file.additions = git_file.additions
+                    file.diff_chunks = git_file.diff_chunks
+                    file.lines_added = git_file.lines_added
     if not files:
         logger.info("No source files need checking!")
-    else:
+    elif logger.isEnabledFor(logging.INFO):
         logger.info(
             "Giving attention to the following files:\n\t%s",
-            "\n\t".join([f.name for f in files]),
+            "\n\t".join(f.name for f in files),
         )
     end_log_group()
 
@@ -1,23 +1,36 @@
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import islice
 import json
+import os
 from pathlib import Path
 import re
 import subprocess
-from typing import Optional, List, Dict, Tuple, cast
+from typing import Optional, List, Dict, Tuple, NamedTuple, cast
 import shutil
 
 from ..common_fs import FileObj, FileIOTimeout
 from ..common_fs.file_filter import TidyFileFilter, FormatFileFilter
-from ..loggers import start_log_group, end_log_group, worker_log_init, logger
-from .clang_tidy import run_clang_tidy, TidyAdvice
+from ..loggers import (
+    start_log_group,
+    end_log_group,
+    worker_log_init,
+    restore_logger_config,
+    logger,
+)
+from .clang_tidy import run_clang_tidy, index_compilation_database, TidyAdvice
 from .clang_format import run_clang_format, FormatAdvice
 from ..cli import Args
 
 
+@lru_cache(maxsize=8)
 def assemble_version_exec(tool_name: str, specified_version: str) -> Optional[str]:
     """Assembles the command to the executable of the given clang tool based on given
     version information.
 
+    The result is memoized because searching the ``PATH`` for an executable is
+    repeated for the same arguments.
+
     :param tool_name: The name of the clang tool to be executed.
     :param specified_version: The version number or the installed path to a version of
         the tool's executable.
@@ -34,23 +47,39 @@ def assemble_version_exec(tool_name: str, specified_version: str) -> Optional[st
     return shutil.which(tool_name)
 
 
+class _WorkerContext(NamedTuple):
+    """The information shared by all files analyzed in a worker process."""
+
+    log_lvl: int
+    tidy_cmd: Optional[str]
+    db_json: Optional[Dict[str, str]]
+    format_cmd: Optional[str]
+    args: Args
+    clang_versions: Optional["ClangVersions"]
+
+
+# Set once per worker process (by `_init_worker()`), so the compilation database and
+# other shared info is not pickled for every file submitted to the worker pool.
+_worker_context: Optional[_WorkerContext] = None
+
+
+def _init_worker(context: Optional[_WorkerContext]) -> None:
+    global _worker_context
+    _worker_context = context
+
+
 def _run_on_single_file(
     file: FileObj,
-    log_lvl: int,
-    tidy_cmd: Optional[str],
-    db_json: Optional[List[Dict[str, str]]],
-    format_cmd: Optional[str],
-    format_filter: Optional[FormatFileFilter],
-    tidy_filter: Optional[TidyFileFilter],
-    args: Args,
+    run_format: bool,
+    run_tidy: bool,
 ) -> Tuple[str, str, Optional[TidyAdvice], Optional[FormatAdvice]]:
+    assert _worker_context is not None, "worker process was not initialized"
+    log_lvl, tidy_cmd, db_json, format_cmd, args, clang_versions = _worker_context
     log_stream = worker_log_init(log_lvl)
     filename = Path(file.name).as_posix()
 
     format_advice = None
-    if format_cmd is not None and (
-        format_filter is None or format_filter.is_source_or_ignored(file.name)
-    ):
+    if run_format and format_cmd is not None:
         try:
             format_advice = run_clang_format(
                 command=format_cmd,
@@ -58,6 +87,7 @@ def _run_on_single_file(
                 style=args.style,
                 lines_changed_only=args.lines_changed_only,
                 format_review=args.format_review,
+                tool_version=None if clang_versions is None else clang_versions.format,
             )
         except FileIOTimeout:  # pragma: no cover
             logger.error(
@@ -70,9 +100,7 @@ def _run_on_single_file(
             )
 
     tidy_note = None
-    if tidy_cmd is not None and (
-        tidy_filter is None or tidy_filter.is_source_or_ignored(file.name)
-    ):
+    if run_tidy and tidy_cmd is not None:
         try:
             tidy_note = run_clang_tidy(
                 command=tidy_cmd,
@@ -84,6 +112,7 @@ def _run_on_single_file(
                 db_json=db_json,
                 tidy_review=args.tidy_review,
                 style=args.style,
+                tool_version=None if clang_versions is None else clang_versions.tidy,
             )
         except FileIOTimeout:  # pragma: no cover
             logger.error(
@@ -98,8 +127,12 @@ def _run_on_single_file(
 VERSION_PATTERN = re.compile(r"version\s(\d+\.\d+\.\d+)")
 
 
+@lru_cache(maxsize=8)
 def _capture_tool_version(cmd: str) -> str:
-    """Get version number from output for executable used."""
+    """Get version number from output for executable used.
+
+    The result is memoized to avoid spawning the executable again for the same
+    ``cmd``."""
     version_out = subprocess.run(
         [cmd, "--version"], capture_output=True, check=True, text=True
     )
@@ -125,6 +158,10 @@ def capture_clang_tools_output(files: List[FileObj], args: Args) -> ClangVersion
 
     :param files: A list of files to analyze.
     :param args: A namespace of parsed args from the :doc:`CLI <../cli_args>`.
+
+    .. note::
+        If :std:option:`--cache-advice` is enabled, then the clang tools' output is
+        cached in the :attr:`~cpp_linter.common_fs.CACHE_PATH`.
     """
 
     tidy_cmd, format_cmd = (None, None)
@@ -150,48 +187,91 @@ def capture_clang_tools_output(files: List[FileObj], args: Args) -> ClangVersion
             ignore_value=args.ignore_tidy,
         )
 
-    db_json: Optional[List[Dict[str, str]]] = None
+    db_json: Optional[Dict[str, str]] = None
     if args.database:
         db = Path(args.database)
         if not db.is_absolute():
-            args.database = str(db.resolve())
-        db_path = (db / "compile_commands.json").resolve()
+            db = db.resolve()
+            args.database = str(db)
+        db_path = db / "compile_commands.json"
         if db_path.exists():
-            db_json = json.loads(db_path.read_text(encoding="utf-8"))
-
-    with ProcessPoolExecutor(args.jobs) as executor:
-        log_lvl = logger.getEffectiveLevel()
-        futures = [
-            executor.submit(
-                _run_on_single_file,
-                file,
-                log_lvl=log_lvl,
-                tidy_cmd=tidy_cmd,
-                db_json=db_json,
-                format_cmd=format_cmd,
-                format_filter=format_filter,
-                tidy_filter=tidy_filter,
-                args=args,
-            )
-            for file in files
-        ]
-
-        # temporary cache of parsed notifications for use in log commands
-        for future in as_completed(futures):
-            file_name, logs, tidy_advice, format_advice = future.result()
-
-            start_log_group(f"Performing checkup on {file_name}")
-            print(logs, flush=True)
-            end_log_group()
-
-            if tidy_advice or format_advice:
-                for file in files:
-                    if file.name == file_name:
-                        if tidy_advice:
-                            file.tidy_advice = tidy_advice
-                        if format_advice:
-                            file.format_advice = format_advice
-                        break
-                else:  # pragma: no cover
-                    raise ValueError(f"Failed to find {file_name} in list of files.")
+            db_json = index_compilation_database(json.loads(db_path.read_bytes()))
+
+    # skip any file that is ignored by both clang tools
+    jobs: List[Tuple[FileObj, bool, bool]] = []
+    for file in files:
+        run_format = format_cmd is not None and (
+            format_filter is None or format_filter.is_source_or_ignored(file.name)
+        )
+        run_tidy = tidy_cmd is not None and (
+            tidy_filter is None or tidy_filter.is_source_or_ignored(file.name)
+        )
+        if run_format or run_tidy:
+            jobs.append((file, run_format, run_tidy))
+    if not jobs:
+        return clang_versions
+
+    # don't spawn more workers than there are files to analyze
+    max_workers = min(args.jobs or os.cpu_count() or 1, len(jobs))
+    context = _WorkerContext(
+        log_lvl=logger.getEffectiveLevel(),
+        tidy_cmd=tidy_cmd,
+        db_json=db_json,
+        format_cmd=format_cmd,
+        args=args,
+        # the tools' versions are only given to enable caching
+        clang_versions=clang_versions if args.cache_advice else None,
+    )
+    files_by_name = {file.name: file for file in files}
+    if max_workers == 1:
+        # Starting a worker process is not worth it for a single job.
+        _init_worker(context)
+        try:
+            with restore_logger_config():
+                for job in jobs:
+                    _store_result(_run_on_single_file(*job), files_by_name)
+        finally:
+            _init_worker(None)  # don't keep the context (& database) alive
+        return clang_versions
+
+    with ProcessPoolExecutor(
+        max_workers, initializer=_init_worker, initargs=(context,)
+    ) as executor:
+        # Only keep a couple of files queued per worker. Any remaining files are
+        # submitted as others finish, so the results (and their captured logs)
+        # don't pile up in memory while waiting to be collected.
+        queued_jobs = iter(jobs)
+        futures = {
+            executor.submit(_run_on_single_file, *job)
+            for job in islice(queued_jobs, max_workers * 2)
+        }
+
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_job = next(queued_jobs, None)
+                if next_job is not None:
+                    futures.add(executor.submit(_run_on_single_file, *next_job))
+                _store_result(future.result(), files_by_name)
     return clang_versions
+
+
+def _store_result(
+    result: Tuple[str, str, Optional[TidyAdvice], Optional[FormatAdvice]],
+    files_by_name: Dict[str, FileObj],
+) -> None:
+    """Output the captured logs and save the advice from `_run_on_single_file()`."""
+    file_name, logs, tidy_advice, format_advice = result
+
+    start_log_group(f"Performing checkup on {file_name}")
+    print(logs, flush=True)
+    end_log_group()
+
+    if tidy_advice or format_advice:
+        file = files_by_name.get(file_name)
+        if file is None:  # pragma: no cover
+            raise ValueError(f"Failed to find {file_name} in list of files.")
+        if tidy_advice:
+            file.tidy_advice = tidy_advice
+        if format_advice:
+            file.format_advice = format_advice
@@ -1,12 +1,19 @@
 """Parse output from clang-format's XML suggestions."""
 
+from bisect import bisect_right
+import io
 from pathlib import PurePath
 import subprocess
-from typing import List, cast
+from typing import Dict, List, Optional, Union, cast
 
 import xml.etree.ElementTree as ET
 
-from ..common_fs import get_line_cnt_from_cols, FileObj
+from ..common_fs import (
+    FileObj,
+    get_cache_key,
+    read_cache,
+    write_cache,
+)
 from ..loggers import logger
 from .patcher import PatchMixin
 
@@ -97,7 +104,7 @@ def tally_format_advice(files: List[FileObj]) -> int:
 
 
 def formalize_style_name(style: str) -> str:
-    if style.startswith("llvm") or style.startswith("gnu"):
+    if style.startswith(("llvm", "gnu")):
         return style.upper()
     if style in (
         "google",
@@ -111,12 +118,20 @@ def formalize_style_name(style: str) -> str:
     return "Custom"
 
 
+def _is_line_in_ranges(
+    line: int, ranges: List[List[int]], range_starts: List[int]
+) -> bool:
+    """Is the ``line`` in one of the sorted (non-overlapping) ``ranges``?"""
+    index = bisect_right(range_starts, line) - 1
+    return index >= 0 and line < ranges[index][1]
+
+
 def parse_format_replacements_xml(
-    xml_out: str, file_obj: FileObj, lines_changed_only: int
+    xml_out: Union[str, bytes], file_obj: FileObj, lines_changed_only: int
 ) -> FormatAdvice:
     """Parse XML output of replacements from clang-format.
 
-    :param xml_out: A string containing the XML output.
+    :param xml_out: The XML output (either raw `bytes` or a decoded `str`).
     :param file_obj: The source file's info for which the contents of the xml
         that was exported by clang-format.
     :param lines_changed_only: A flag that forces focus on only changes in the event's
@@ -129,33 +144,43 @@ def parse_format_replacements_xml(
         List[List[int]],
         file_obj.range_of_changed_lines(lines_changed_only, get_ranges=True),
     )
-    tree = ET.fromstring(xml_out)
+    if lines_changed_only and not ranges:
+        return format_advice  # no replacement can be in the changed lines
+    # the diff's ranges of lines don't overlap, so they can be binary searched
+    ranges = sorted(ranges)
+    range_starts = [r[0] for r in ranges]
     content = file_obj.read_with_timeout()
-    for child in tree:
+    # clang-format lists replacements in ascending order of offset, so lines are
+    # counted from the previous replacement's offset (instead of the file's start)
+    prev_offset, line, line_start = (0, 1, -1)
+    replaced_lines: Dict[int, FormatReplacementLine] = {}
+    # stream the replacements instead of building the whole element tree
+    xml_stream = (
+        io.BytesIO(xml_out) if isinstance(xml_out, bytes) else io.StringIO(xml_out)
+    )
+    for _, child in ET.iterparse(xml_stream):
         if child.tag == "replacement":
-            null_len = int(child.attrib["length"])
+            attrib = child.attrib
+            null_len = int(attrib["length"])
             text = "" if child.text is None else child.text
-            offset = int(child.attrib["offset"])
-            line, cols = get_line_cnt_from_cols(content, offset)
-            is_line_in_ranges = False
-            for r in ranges:
-                if line in range(r[0], r[1]):  # range is inclusive
-                    is_line_in_ranges = True
-                    break
-            if is_line_in_ranges or lines_changed_only == 0:
-                fix = FormatReplacement(cols, null_len, text)
-                if not format_advice.replaced_lines or (
-                    format_advice.replaced_lines
-                    and line != format_advice.replaced_lines[-1].line
-                ):
+            offset = int(attrib["offset"])
+            child.clear()  # free the parsed element
+            if offset < prev_offset:  # pragma: no cover
+                # not in ascending order; start counting from the file's start
+                prev_offset, line, line_start = (0, 1, -1)
+            line += content.count(b"\n", prev_offset, offset)
+            line_start = max(line_start, content.rfind(b"\n", prev_offset, offset))
+            prev_offset = offset
+            cols = offset - line_start
+            if lines_changed_only == 0 or _is_line_in_ranges(
+                line, ranges, range_starts
+            ):
+                line_fix = replaced_lines.get(line)
+                if line_fix is None:
                     line_fix = FormatReplacementLine(line)
-                    line_fix.replacements.append(fix)
-                    format_advice.replaced_lines.append(line_fix)
-                elif (
-                    format_advice.replaced_lines
-                    and line == format_advice.replaced_lines[-1].line
-                ):
-                    format_advice.replaced_lines[-1].replacements.append(fix)
+                    replaced_lines[line] = line_fix
+                line_fix.replacements.append(FormatReplacement(cols, null_len, text))
+    format_advice.replaced_lines = [replaced_lines[k] for k in sorted(replaced_lines)]
     return format_advice
 
 
@@ -165,6 +190,7 @@ def run_clang_format(
     style: str,
     lines_changed_only: int,
     format_review: bool,
+    tool_version: Optional[str] = None,
 ) -> FormatAdvice:
     """Run clang-format on a certain file
 
@@ -176,6 +202,9 @@ def run_clang_format(
         diff info.
     :param format_review: A flag to enable/disable creating a diff suggestion for
         PR review comments.
+    :param tool_version: The version of clang-format being used. If this is given,
+        then clang-format's output is cached in the `CACHE_PATH` and reused for any
+        identical invocation on unchanged file contents.
     """
     cmds = [
         command,
@@ -189,20 +218,40 @@ def run_clang_format(
     for span in ranges:
         cmds.append(f"--lines={span[0]}:{span[1]}")
     cmds.append(PurePath(file_obj.name).as_posix())
-    logger.info('Running "%s"', " ".join(cmds))
-    results = subprocess.run(cmds, capture_output=True)
-    if results.returncode:
-        logger.debug(
-            "%s raised the following error(s):\n%s", cmds[0], results.stderr.decode()
-        )
+    cache_key: Optional[str] = None
+    xml_out: Optional[bytes] = None
+    if tool_version is not None:
+        cache_key = get_cache_key(tool_version, *cmds, file_obj.read_with_timeout())
+        xml_out = read_cache("clang-format", cache_key)
+    if xml_out is not None:
+        logger.info('Using cached output of "%s"', " ".join(cmds))
+    else:
+        logger.info('Running "%s"', " ".join(cmds))
+        results = subprocess.run(cmds, capture_output=True)
+        xml_out = results.stdout
+        if results.returncode:
+            logger.debug(
+                "%s raised the following error(s):\n%s",
+                cmds[0],
+                results.stderr.decode(),
+            )
+        elif cache_key is not None:
+            write_cache("clang-format", cache_key, xml_out)
     advice = parse_format_replacements_xml(
-        results.stdout.decode(encoding="utf-8").strip(), file_obj, lines_changed_only
+        xml_out.strip(), file_obj, lines_changed_only
     )
     if format_review:
         del cmds[2]  # remove `--output-replacements-xml` flag
-        logger.info('Getting fixes with "%s"', " ".join(cmds))
-        # get formatted file from stdout
-        formatted_output = subprocess.run(cmds, capture_output=True, check=True)
+        patched: Optional[bytes] = None
+        if cache_key is not None:
+            patched = read_cache("clang-format", f"{cache_key}.patched")
+        if patched is None:
+            logger.info('Getting fixes with "%s"', " ".join(cmds))
+            # get formatted file from stdout
+            formatted_output = subprocess.run(cmds, capture_output=True, check=True)
+            patched = formatted_output.stdout
+            if cache_key is not None:
+                write_cache("clang-format", f"{cache_key}.patched", patched)
         # store formatted_output (for comparing later)
-        advice.patched = formatted_output.stdout
+        advice.patched = patched
     return advice
@@ -1,17 +1,35 @@
 """Parse output from clang-tidy's stdout"""
 
+from functools import lru_cache
 import json
+import logging
 import os
-from pathlib import Path, PurePath
+from pathlib import Path
 import re
 import subprocess
 from typing import Tuple, Union, List, cast, Optional, Dict, Set
 from ..loggers import logger
-from ..common_fs import FileObj
+from ..common_fs import FileObj, get_cache_key, read_cache, write_cache
 from .patcher import PatchMixin, ReviewComments, Suggestion
 
 NOTE_HEADER = re.compile(r"^(.+):(\d+):(\d+):\s(\w+):(.*)\[([a-zA-Z\d\-\.]+)\]$")
-FIXED_NOTE = re.compile(r"^.+:(\d+):\d+:\snote: FIX-IT applied suggested code changes$")
+FIXED_NOTE_SUFFIX = "note: FIX-IT applied suggested code changes"
+FIXED_NOTE = re.compile(r"^.+:(\d+):\d+:\s" + FIXED_NOTE_SUFFIX + "$")
+
+
+@lru_cache(maxsize=None)
+def _diagnostic_link(diagnostic: str) -> str:
+    """Creates a markdown link to the documentation of a clang-tidy ``diagnostic``.
+
+    The result is memoized because many notifications share the same diagnostic."""
+    if diagnostic.startswith("clang-diagnostic-"):
+        return diagnostic
+    link = f"[{diagnostic}](https://clang.llvm.org/extra/clang-tidy/checks/"
+    if diagnostic.startswith("clang-analyzer-"):
+        check_name_parts = diagnostic.split("-", maxsplit=2)
+        assert len(check_name_parts) > 2, "diagnostic name malformed"
+        return link + "clang-analyzer/{}.html)".format(check_name_parts[2])
+    return link + "{}/{}.html)".format(*diagnostic.split("-", maxsplit=1))
 
 
 class TidyNotification:
@@ -21,15 +39,18 @@ class TidyNotification:
     :param notification_line: The first line in the notification parsed into a
         `tuple` of `str` that represent the different components of the
         notification's details.
-    :param database: The compilation database deserialized from JSON, only if
-        :std:option:`--database` argument points to a valid path containing a
-        ``compile_commands.json file``.
+    :param database: The compilation database deserialized from JSON (or indexed with
+        `index_compilation_database()`), only if :std:option:`--database` argument
+        points to a valid path containing a ``compile_commands.json file``.
+    :param cwd: The current working directory (as a POSIX path). This is looked up
+        if not given.
     """
 
     def __init__(
         self,
         notification_line: Tuple[str, Union[int, str], Union[int, str], str, str, str],
-        database: Optional[List[Dict[str, str]]] = None,
+        database: Optional[Union[List[Dict[str, str]], Dict[str, str]]] = None,
+        cwd: Optional[str] = None,
     ):
         # logger.debug("Creating tidy note from line %s", notification_line)
         (
@@ -50,31 +71,20 @@ class TidyNotification:
         #: The line number of the source file.
         self.line = int(self.line)
         self.cols = int(self.cols)
-        rel_path = (
-            Path(self.filename)
-            .resolve()
-            .as_posix()
-            .replace(Path.cwd().as_posix() + "/", "")
-        )
-        if not PurePath(self.filename).is_absolute() and database is not None:
+        file_path = Path(self.filename)
+        if not file_path.is_absolute() and database is not None:
             # get absolute path from compilation database:
             # This is need for meson builds as they use paths relative to
             # the build env (or wherever the database is usually located).
-            for unit in database:
-                if (
-                    "file" in unit
-                    and "directory" in unit
-                    and unit["file"] == self.filename
-                ):
-                    rel_path = (
-                        Path(unit["directory"], unit["file"])
-                        .resolve()
-                        .as_posix()
-                        .replace(Path.cwd().as_posix() + "/", "")
-                    )
-                    break
+            if isinstance(database, list):
+                database = index_compilation_database(database)
+            directory = database.get(self.filename)
+            if directory is not None:
+                file_path = Path(directory, self.filename)
+        if cwd is None:
+            cwd = Path.cwd().as_posix()
         #: The source filename concerning the notification.
-        self.filename = rel_path
+        self.filename = file_path.resolve().as_posix().removeprefix(cwd + "/")
         #: A `list` of lines for the code-block in the notification.
         self.fixit_lines: List[str] = []
         #: A list of line numbers where a suggested fix was applied.
@@ -83,14 +93,7 @@ class TidyNotification:
     @property
     def diagnostic_link(self) -> str:
         """Creates a markdown link to the diagnostic documentation."""
-        if self.diagnostic.startswith("clang-diagnostic-"):
-            return self.diagnostic
-        link = f"[{self.diagnostic}](https://clang.llvm.org/extra/clang-tidy/checks/"
-        if self.diagnostic.startswith("clang-analyzer-"):
-            check_name_parts = self.diagnostic.split("-", maxsplit=2)
-            assert len(check_name_parts) > 2, "diagnostic name malformed"
-            return link + "clang-analyzer/{}.html)".format(check_name_parts[2])
-        return link + "{}/{}.html)".format(*self.diagnostic.split("-", maxsplit=1))
+        return _diagnostic_link(self.diagnostic)
 
     def __repr__(self) -> str:
         return (
@@ -111,7 +114,7 @@ class TidyAdvice(PatchMixin):
         diagnostics = ""
         for note in self.notes:
             for fix_line in note.applied_fixes:
-                if fix_line in range(start, end + 1):  # range is inclusive
+                if start <= fix_line <= end:
                     diagnostics += f"- {note.rationale} [{note.diagnostic_link}]\n"
                     break
         return diagnostics
@@ -166,7 +169,21 @@ class TidyAdvice(PatchMixin):
                     suggestion.comment = body
                     review_comments.tool_total["clang-tidy"] += 1
                     if not _has_related_suggestion(suggestion):
-                        review_comments.suggestions.append(suggestion)
+                        review_comments.add_suggestion(suggestion)
+
+
+def index_compilation_database(db_json: List[Dict[str, str]]) -> Dict[str, str]:
+    """Index a compilation database's entries by ``file`` name.
+
+    :param db_json: The compilation database deserialized from JSON.
+    :returns: A `dict` of each entry's ``directory`` keyed by the entry's ``file``.
+        If a ``file`` is listed more than once, then the first entry is used.
+    """
+    index: Dict[str, str] = {}
+    for unit in db_json:
+        if "file" in unit and "directory" in unit:
+            index.setdefault(unit["file"], unit["directory"])
+    return index
 
 
 def tally_tidy_advice(files: List[FileObj]) -> int:
@@ -190,9 +207,10 @@ def run_clang_tidy(
     lines_changed_only: int,
     database: str,
     extra_args: List[str],
-    db_json: Optional[List[Dict[str, str]]],
+    db_json: Optional[Union[List[Dict[str, str]], Dict[str, str]]],
     tidy_review: bool,
     style: str,
+    tool_version: Optional[str] = None,
 ) -> TidyAdvice:
     """Run clang-tidy on a certain file.
 
@@ -220,11 +238,14 @@ def run_clang_tidy(
             .. code-block:: shell
 
                 cpp-linter --extra-arg=-std=c++14 --extra-arg=-Wall
-    :param db_json: The compilation database deserialized from JSON, only if
-        ``database`` parameter points to a valid path containing a
-        ``compile_commands.json file``.
+    :param db_json: The compilation database deserialized from JSON (or indexed with
+        `index_compilation_database()`), only if ``database`` parameter points to a
+        valid path containing a ``compile_commands.json file``.
     :param tidy_review: A flag to enable/disable creating a diff suggestion for
         PR review comments.
+    :param tool_version: The version of clang-tidy being used. If this is given,
+        then clang-tidy's output is cached in the `CACHE_PATH` and reused for any
+        identical invocation on unchanged file contents.
     """
     filename = file_obj.name.replace("/", os.sep)
     cmds = [command]
@@ -247,45 +268,83 @@ def run_clang_tidy(
     for extra_arg in extra_args:
         arg = extra_arg.strip('"')
         cmds.append(f"--extra-arg={arg}")
-    if tidy_review:
+    original_buf = b""
+    if tidy_review or tool_version is not None:
         # clang-tidy overwrites the file contents when applying fixes.
         # create a cache of original contents
         original_buf = file_obj.read_with_timeout()
+    if tidy_review:
         cmds.append("--fix-errors")  # include compiler-suggested fixes
     cmds.append(filename)
-    logger.info('Running "%s"', " ".join(cmds))
-    results = subprocess.run(cmds, capture_output=True)
-    logger.debug("Output from clang-tidy:\n%s", results.stdout.decode())
-    if results.stderr:
-        logger.debug(
-            "clang-tidy made the following summary:\n%s", results.stderr.decode()
-        )
-
-    advice = parse_tidy_output(results.stdout.decode(), database=db_json)
-
-    if tidy_review:
-        # store the modified output from clang-tidy and re-write original file contents
-        advice.patched = file_obj.read_write_with_timeout(original_buf)
 
+    cache_key: Optional[str] = None
+    tidy_out: Optional[bytes] = None
+    patched: Optional[bytes] = None
+    if tool_version is not None:
+        cache_key = get_cache_key(tool_version, *cmds, original_buf)
+        tidy_out = read_cache("clang-tidy", cache_key)
+        if tidy_out is not None and tidy_review:
+            patched = read_cache("clang-tidy", f"{cache_key}.patched")
+            if patched is None:  # pragma: no cover
+                tidy_out = None  # incomplete cache entry; run clang-tidy again
+
+    if tidy_out is not None:
+        logger.info('Using cached output of "%s"', " ".join(cmds))
+    else:
+        logger.info('Running "%s"', " ".join(cmds))
+        results = subprocess.run(cmds, capture_output=True)
+        tidy_out = results.stdout
+        # don't decode clang-tidy's (potentially large) output just to discard it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Output from clang-tidy:\n%s", tidy_out.decode())
+            if results.stderr:
+                logger.debug(
+                    "clang-tidy made the following summary:\n%s",
+                    results.stderr.decode(),
+                )
+        if tidy_review:
+            # store the modified output from clang-tidy and re-write original file
+            # contents
+            patched = file_obj.read_write_with_timeout(original_buf)
+        # clang-tidy exits with a non-zero code for errors found in the file, but
+        # its output is incomplete if it was killed (by a signal)
+        if cache_key is not None and results.returncode >= 0:
+            write_cache("clang-tidy", cache_key, tidy_out)
+            if patched is not None:
+                write_cache("clang-tidy", f"{cache_key}.patched", patched)
+
+    advice = parse_tidy_output(tidy_out.decode(), database=db_json)
+    advice.patched = patched
     return advice
 
 
 def parse_tidy_output(
-    tidy_out: str, database: Optional[List[Dict[str, str]]]
+    tidy_out: str, database: Optional[Union[List[Dict[str, str]], Dict[str, str]]]
 ) -> TidyAdvice:
     """Parse clang-tidy stdout.
 
     :param tidy_out: The stdout from clang-tidy.
-    :param database: The compilation database deserialized from JSON, only if
-        :std:option:`--database` argument points to a valid path containing a
-        ``compile_commands.json file``.
+    :param database: The compilation database deserialized from JSON (or indexed with
+        `index_compilation_database()`), only if :std:option:`--database` argument
+        points to a valid path containing a ``compile_commands.json file``.
     """
+    if isinstance(database, list):
+        database = index_compilation_database(database)
+    cwd = Path.cwd().as_posix()
     notification = None
     found_fix = False
     tidy_notes = []
+    match_note_header = NOTE_HEADER.match
+    match_fixed_note = FIXED_NOTE.match
     for line in tidy_out.splitlines():
-        note_match = re.match(NOTE_HEADER, line)
-        fixed_match = re.match(FIXED_NOTE, line)
+        # a notification's header always ends with the check's name in brackets,
+        # so don't bother with the regex for other lines (like code snippets)
+        note_match = match_note_header(line) if line.endswith("]") else None
+        fixed_match = (
+            match_fixed_note(line)
+            if note_match is None and line.endswith(FIXED_NOTE_SUFFIX)
+            else None
+        )
         if note_match is not None:
             notification = TidyNotification(
                 cast(
@@ -293,6 +352,7 @@ def parse_tidy_output(
                     note_match.groups(),
                 ),
                 database,
+                cwd,
             )
             tidy_notes.append(notification)
             # begin capturing subsequent lines as part of notification details
@@ -62,24 +62,35 @@ class ReviewComments:
         A `None` value means a review was not requested from the corresponding tool.
         """
 
-        self.full_patch: Dict[str, str] = {"clang-tidy": "", "clang-format": ""}
+        self.full_patch: Dict[str, List[str]] = {"clang-tidy": [], "clang-format": []}
         """The full patch of all the suggestions (including those that will not
-        fit within the diff)"""
+        fit within the diff). Each tool's patch is kept as a list of every file's
+        patch."""
+
+        # `suggestions` indexed by file name and line range (see `add_suggestion()`)
+        self._suggestions_by_range: Dict[Tuple[str, int, int], Suggestion] = {}
+
+    def add_suggestion(self, suggestion: Suggestion) -> None:
+        """Add a ``suggestion`` to the `suggestions`, so that similar suggestions can
+        be merged into it with `merge_similar_suggestion()`."""
+        self.suggestions.append(suggestion)
+        self._suggestions_by_range.setdefault(
+            (suggestion.file_name, suggestion.line_start, suggestion.line_end),
+            suggestion,
+        )
 
     def merge_similar_suggestion(self, suggestion: Suggestion) -> bool:
         """Merge a given ``suggestion`` into a similar `Suggestion`
 
         :returns: `True` if the suggestion was merged, otherwise `False`.
         """
-        for known in self.suggestions:
-            if (
-                known.file_name == suggestion.file_name
-                and known.line_end == suggestion.line_end
-                and known.line_start == suggestion.line_start
-            ):
-                known.comment += f"\n{suggestion.comment}"
-                return True
-        return False
+        known = self._suggestions_by_range.get(
+            (suggestion.file_name, suggestion.line_start, suggestion.line_end)
+        )
+        if known is None:
+            return False
+        known.comment += f"\n{suggestion.comment}"
+        return True
 
     def serialize_to_github_payload(
         # avoid circular imports by accepting primitive types (instead of ClangVersions)
@@ -126,10 +137,11 @@ class ReviewComments:
                     + f"{self.tool_total[tool_name]} {tool_name}"
                     + " concerns fit within this pull request's diff.\n"
                 )
-            if self.full_patch[tool_name]:
+            full_patch = "".join(self.full_patch[tool_name])
+            if full_patch:
                 summary += (
                     f"\n<details><summary>Click here for the full {tool_name} patch"
-                    + f"</summary>\n\n\n```diff\n{self.full_patch[tool_name]}\n"
+                    + f"</summary>\n\n\n```diff\n{full_patch}\n"
                     + "```\n\n\n</details>\n\n"
                 )
             elif not self.tool_total[tool_name]:
@@ -180,13 +192,15 @@ class PatchMixin(ABC):
         )
         tool_name = self.get_tool_name()
         assert tool_name in review_comments.full_patch
-        review_comments.full_patch[tool_name] += f"{patch.text}"
+        review_comments.full_patch[tool_name].append(patch.text or "")
         assert tool_name in review_comments.tool_total
-        tool_total = review_comments.tool_total[tool_name] or 0
-        for hunk in patch.hunks:
-            tool_total += 1
-            if summary_only:
-                continue
+        hunks = patch.hunks
+        review_comments.tool_total[tool_name] = (
+            review_comments.tool_total[tool_name] or 0
+        ) + len(hunks)
+        if summary_only:
+            return  # only the number of hunks is needed
+        for hunk in hunks:
             new_hunk_range = file_obj.is_hunk_contained(hunk)
             if new_hunk_range is None:
                 continue
@@ -197,13 +211,14 @@ class PatchMixin(ABC):
                 comment.line_start = start_line
             comment.line_end = end_line
             removed = []
-            suggestion = ""
+            suggested_lines = []
             for line in hunk.lines:
                 if line.origin in ("+", " "):
-                    suggestion += f"{line.content}"
+                    suggested_lines.append(line.content)
                 else:
                     line_numb = line.old_lineno
                     removed.append(line_numb)
+            suggestion = "".join(suggested_lines)
             if not suggestion and removed:
                 body += "\nPlease remove the line(s)\n- "
                 body += "\n- ".join([str(x) for x in removed])
@@ -211,6 +226,4 @@ class PatchMixin(ABC):
                 body += f"\n```suggestion\n{suggestion}```"
             comment.comment = body
             if not review_comments.merge_similar_suggestion(comment):
-                review_comments.suggestions.append(comment)
-
-        review_comments.tool_total[tool_name] = tool_total
+                review_comments.add_suggestion(comment)
@@ -69,6 +69,8 @@ class Args(UserDict):
     ignore_format: str = ""
     #: See :std:option:`--passive-reviews`.
     passive_reviews: bool = False
+    #: See :std:option:`--cache-advice`.
+    cache_advice: bool = False
 
 
 _parser_args: Dict[Sequence[str], Any] = {}
@@ -385,6 +387,29 @@ Defaults to ``%(default)s``.""",
 )
 
 
+_parser_args[("-C", "--cache-advice")] = dict(
+    default="false",
+    type=lambda input: input.lower() == "true",
+    help="""Set to ``true`` to cache the output of clang-tidy
+and clang-format, and reuse it when the same tool
+version and command are used on unchanged file contents.
+
+The cache is stored in the ``.cpp-linter_cache`` folder
+(or the path set by the ``CPP_LINTER_CACHE`` environment
+variable) of the :std:option:`--repo-root`.
+
+.. warning::
+    The cache is never pruned, so its size grows with each
+    change analyzed. Changes to included headers, the
+    compilation database (see :std:option:`--database`),
+    or a ``.clang-tidy`` or ``.clang-format`` configuration
+    file do not invalidate cached output. Clear the cache
+    when any of these change.
+
+Defaults to ``%(default)s``.""",
+)
+
+
 def get_cli_parser() -> argparse.ArgumentParser:
     cli_parser = argparse.ArgumentParser(
         description=(
@@ -1,3 +1,5 @@
+import hashlib
+import os
 from os import environ
 from pathlib import Path
 import time
@@ -10,7 +12,9 @@ if TYPE_CHECKING:  # pragma: no covers
     from ..clang_tools.clang_tidy import TidyAdvice
     from ..clang_tools.clang_format import FormatAdvice
 
-#: A path to generated cache artifacts. (only used when verbosity is in debug mode)
+#: A path to generated cache artifacts. This is used for debugging artifacts (when
+#: verbosity is in debug mode) and for cached clang tools' output (when
+#: :std:option:`--cache-advice` is enabled).
 CACHE_PATH = Path(environ.get("CPP_LINTER_CACHE", ".cpp-linter_cache"))
 
 
@@ -25,6 +29,15 @@ class FileObj:
         for all hunks in the diff.
     """
 
+    __slots__ = (
+        "name",
+        "additions",
+        "diff_chunks",
+        "lines_added",
+        "tidy_advice",
+        "format_advice",
+    )
+
     def __init__(
         self,
         name: str,
@@ -63,14 +76,11 @@ class FileObj:
             describing the starting and ending lines of all line ``numbers``.
         """
         result: List[List[int]] = []
-        for i, n in enumerate(numbers):
-            if not i:
-                result.append([n])
-            elif n - 1 != numbers[i - 1]:
-                result[-1].append(numbers[i - 1] + 1)
-                result.append([n])
-            if i == len(numbers) - 1:
-                result[-1].append(n + 1)
+        for n in numbers:
+            if result and n == result[-1][1]:
+                result[-1][1] = n + 1  # extend the current range
+            else:
+                result.append([n, n + 1])  # begin a new range
         return result
 
     def range_of_changed_lines(
@@ -278,5 +288,67 @@ def get_line_cnt_from_cols(data: bytes, offset: int) -> Tuple[int, int]:
         - Index 1 is the column number for the given offset on the line.
     """
     # logger.debug("Getting line count from %s at offset %d", file_path, offset)
-    contents = data[:offset]
-    return (contents.count(b"\n") + 1, offset - contents.rfind(b"\n"))
+    # search within bounds instead of slicing to avoid copying the data
+    return (
+        data.count(b"\n", 0, offset) + 1,
+        offset - data.rfind(b"\n", 0, offset),
+    )
+
+
+def get_cache_key(*parts: Union[str, bytes]) -> str:
+    """Create a key for a cached artifact from the given ``parts``.
+
+    :param parts: The information that uniquely identifies the cached artifact.
+        Typically, this includes the clang tool's version, the command used to invoke
+        the clang tool, and the analyzed file's contents.
+
+    :returns: A hexadecimal SHA256 digest of all the given ``parts``.
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        hasher.update(b"\0")  # delimit parts to avoid ambiguous concatenations
+    return hasher.hexdigest()
+
+
+def _get_cache_file(tool_name: str, key: str) -> Path:
+    return CACHE_PATH / tool_name / key[:2] / key
+
+
+def read_cache(tool_name: str, key: str) -> Optional[bytes]:
+    """Read a cached output of a clang tool.
+
+    :param tool_name: The name of the clang tool that produced the output.
+    :param key: The key returned from `get_cache_key()`.
+
+    :returns: The cached bytes or `None` if the ``key`` is not cached.
+    """
+    try:
+        return _get_cache_file(tool_name, key).read_bytes()
+    except OSError:
+        return None
+
+
+def write_cache(tool_name: str, key: str, data: bytes) -> None:
+    """Write an output of a clang tool to the cache.
+
+    The cached file is replaced atomically, so concurrent workers never read a
+    partially written cache entry.
+
+    :param tool_name: The name of the clang tool that produced the output.
+    :param key: The key returned from `get_cache_key()`.
+    :param data: The bytes to cache.
+    """
+    cache_file = _get_cache_file(tool_name, key)
+    tmp_file = cache_file.with_name(f"{key}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+    except OSError as exc:
+        # a cache is only an optimization; failing to write it should not fail
+        logger.debug("Failed to cache output of %s: %s", tool_name, exc)
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
@@ -1,4 +1,5 @@
 import configparser
+import os
 from pathlib import Path, PurePath
 from typing import List, Optional, Set
 from . import FileObj
@@ -37,18 +38,17 @@ class FileFilter:
         This will add each submodule to the `ignored` list unless already specified as
         `not_ignored`."""
         git_modules = Path(path)
-        if git_modules.exists():
-            git_modules_parent = git_modules.parent
-            submodules = configparser.ConfigParser()
-            submodules.read(git_modules.resolve().as_posix())
-            for module in submodules.sections():
-                sub_mod_path = git_modules_parent / submodules[module]["path"]
-                if not self.is_file_in_list(ignored=False, file_name=sub_mod_path):
-                    sub_mod_posix = sub_mod_path.as_posix()
-                    logger.info(
-                        "Appending submodule to ignored paths: %s", sub_mod_posix
-                    )
-                    self.ignored.add(sub_mod_posix)
+        submodules = configparser.ConfigParser()
+        # `read()` silently skips a missing file, so no need to stat it beforehand
+        if not submodules.read(git_modules.as_posix()):
+            return
+        git_modules_parent = git_modules.parent
+        for module in submodules.sections():
+            sub_mod_path = git_modules_parent / submodules[module]["path"]
+            if not self.is_file_in_list(ignored=False, file_name=sub_mod_path):
+                sub_mod_posix = sub_mod_path.as_posix()
+                logger.info("Appending submodule to ignored paths: %s", sub_mod_posix)
+                self.ignored.add(sub_mod_posix)
 
     def _parse_ignore_option(self, paths: str):
         """Parse a given string of paths (separated by a ``|``) into ``ignored`` and
@@ -105,7 +105,12 @@ class FileFilter:
         if ignored:
             prompt = "ignored"
             path_list = self.ignored
+        if not path_list:
+            return False
         tool_name = "" if not self._tool_name else f"[{self._tool_name}] "
+        # The file_name is not a directory, so its parent paths (excluding the
+        # repo-root) are only computed once for all patterns.
+        file_parents = [parent for parent in file_name.parents if parent.parts]
         prompt_pattern = ""
         for pattern in path_list:
             prompt_pattern = pattern
@@ -115,16 +120,8 @@ class FileFilter:
                 break
 
             # Lastly, to support ignoring recursively with globs:
-            # We know the file_name is not a directory, so
-            # iterate through its parent paths and compare with the pattern
-            file_parent = file_name.parent
-            matched_parent = False
-            while file_parent.parts:
-                if file_parent.match(pattern):
-                    matched_parent = True
-                    break
-                file_parent = file_parent.parent
-            if matched_parent:
+            # compare the file's parent paths with the pattern
+            if any(parent.match(pattern) for parent in file_parents):
                 break
         else:
             return False
@@ -167,16 +164,30 @@ class FileFilter:
         """
 
         files = []
-        for ext in self.extensions:
-            for rel_path in Path(".").rglob(f"*.{ext}"):
-                for parent in rel_path.parts[:-1]:
-                    if parent.startswith("."):
-                        break
-                else:
-                    file_path = rel_path.as_posix()
-                    logger.debug('"./%s" is a source code file', file_path)
-                    if self.is_source_or_ignored(rel_path.as_posix()):
-                        files.append(FileObj(file_path))
+        # walk the file tree once (instead of once per extension) and
+        # don't descend into hidden directories
+        dirs = [""]
+        while dirs:
+            parent = dirs.pop()
+            try:
+                entries = os.scandir(parent or ".")
+            except PermissionError:
+                logger.debug('Skipping unreadable directory "./%s"', parent)
+                continue
+            with entries:
+                for entry in entries:
+                    file_path = f"{parent}/{entry.name}" if parent else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            dirs.append(file_path)
+                    # like `is_source_or_ignored()`, extensions are case-sensitive
+                    elif (
+                        PurePath(entry.name).suffix.lstrip(".") in self.extensions
+                        and entry.is_file()
+                    ):
+                        logger.debug('"./%s" is a source code file', file_path)
+                        if self.is_source_or_ignored(file_path):
+                            files.append(FileObj(file_path))
         return files
 
 
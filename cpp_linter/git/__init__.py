@@ -3,7 +3,7 @@ related to parsing diff output into a list of changed files."""
 
 import logging
 from pathlib import Path
-from typing import Tuple, List, Optional, cast, Union
+from typing import Tuple, List, Optional, Set, cast, Union
 
 from pygit2 import (  # type: ignore
     Repository,
@@ -88,12 +88,15 @@ def parse_diff(
     diff_obj: Union[Diff, str],
     file_filter: FileFilter,
     lines_changed_only: int,
+    keep_names: Optional[Set[str]] = None,
 ) -> List[FileObj]:
     """Parse a given diff into file objects.
 
     :param diff_obj: The complete git diff object for an event.
     :param file_filter: A `FileFilter` object.
     :param lines_changed_only: A value that dictates what file changes to focus on.
+    :param keep_names: An optional set of file names to keep. Any changed file not
+        in this set is skipped before parsing its changes.
     :returns: A `list` of `FileObj` describing information about the files changed.
 
         .. note:: Deleted files are omitted because we only want to analyze updates.
@@ -104,17 +107,20 @@ def parse_diff(
             diff_obj = Diff.parse_diff(diff_obj)
         except GitError as exc:
             logger.warning(f"pygit2.Diff.parse_diff() threw {exc}")
-            return legacy_parse_diff(diff_obj, file_filter, lines_changed_only)
+            return legacy_parse_diff(
+                diff_obj, file_filter, lines_changed_only, keep_names
+            )
     for patch in diff_obj:
         if patch.delta.status not in ADDITIVE_STATUS:
             continue
-        if not file_filter.is_source_or_ignored(patch.delta.new_file.path):
+        file_name = patch.delta.new_file.path
+        if keep_names is not None and file_name not in keep_names:
+            continue
+        if not file_filter.is_source_or_ignored(file_name):
             continue
         diff_chunks, additions = parse_patch(patch.hunks)
         if has_line_changes(lines_changed_only, diff_chunks, additions):
-            file_objects.append(
-                FileObj(patch.delta.new_file.path, additions, diff_chunks)
-            )
+            file_objects.append(FileObj(file_name, additions, diff_chunks))
     return file_objects
 
 
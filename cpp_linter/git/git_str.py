@@ -3,7 +3,7 @@ binds to). The `parse_diff()` function here is only used when
 :py:meth:`pygit2.Diff.parse_diff()` function fails in `cpp_linter.git.parse_diff()`"""
 
 import re
-from typing import Optional, List, Tuple, cast
+from typing import Optional, List, Set, Tuple, cast
 from ..common_fs import FileObj, has_line_changes
 from ..common_fs.file_filter import FileFilter
 from ..loggers import logger
@@ -41,12 +41,15 @@ def parse_diff(
     full_diff: str,
     file_filter: FileFilter,
     lines_changed_only: int,
+    keep_names: Optional[Set[str]] = None,
 ) -> List[FileObj]:
     """Parse a given diff into file objects.
 
     :param full_diff: The complete diff for an event.
     :param file_filter: A `FileFilter` object.
     :param lines_changed_only: A value that dictates what file changes to focus on.
+    :param keep_names: An optional set of file names to keep. Any changed file not
+        in this set is skipped before parsing its changes.
     :returns: A `list` of `FileObj` instances containing information about the files
         changed.
     """
@@ -65,6 +68,8 @@ def parse_diff(
         filename = cast(str, filename_match.groups(0)[0])
         if first_hunk is None:
             continue
+        if keep_names is not None and filename not in keep_names:
+            continue
         if not file_filter.is_source_or_ignored(filename):
             continue
         diff_chunks, additions = _parse_patch(diff[first_hunk.start() :])
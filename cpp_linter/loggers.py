@@ -1,11 +1,14 @@
+from contextlib import contextmanager
 import logging
 import os
 import io
+from typing import Iterator
 
 from requests import Response
 
 FOUND_RICH_LIB = False
 try:  # pragma: no cover
+    from rich.console import Console  # type: ignore
     from rich.logging import RichHandler, get_console  # type: ignore
 
     FOUND_RICH_LIB = True
@@ -64,11 +67,16 @@ def worker_log_init(log_lvl: int):
     logger.propagate = False
 
     handler: logging.Handler
-    if (
-        FOUND_RICH_LIB and "CPP_LINTER_PYTEST_NO_RICH" not in os.environ
-    ):  # pragma: no cover
-        console = get_console()
-        console.file = log_stream
+    if FOUND_RICH_LIB and "CPP_LINTER_PYTEST_NO_RICH" not in os.environ:
+        # Use a separate console (with the global console's terminal features), so
+        # the global console used by the root logger's handler is not redirected
+        # when this is called from the main process.
+        global_console = get_console()
+        console = Console(
+            file=log_stream,
+            force_terminal=global_console.is_terminal,
+            width=global_console.width,
+        )
         handler = RichHandler(show_time=False, console=console)
         handler.setFormatter(logging.Formatter("%(name)s: %(message)s"))
     else:
@@ -87,3 +95,17 @@ def worker_log_init(log_lvl: int):
     # log_commander.addHandler(console_handler)
 
     return log_stream
+
+
+@contextmanager
+def restore_logger_config() -> Iterator[None]:
+    """Restore the `logger`'s configuration after `worker_log_init()` is used in the
+    main process (instead of a worker process)."""
+    handlers = logger.handlers[:]
+    propagate, level = (logger.propagate, logger.level)
+    try:
+        yield
+    finally:
+        logger.handlers[:] = handlers
+        logger.propagate = propagate
+        logger.setLevel(level)
@@ -6,8 +6,10 @@ from abc import ABC
 from pathlib import PurePath
 import sys
 import time
-from typing import Optional, Dict, List, Any, cast, NamedTuple
+from typing import Optional, Dict, List, Any, Set, cast, NamedTuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..common_fs import FileObj
 from ..common_fs.file_filter import FileFilter
 from ..cli import Args
@@ -39,6 +41,19 @@ class RestApiClient(ABC):
 
     def __init__(self, rate_limit_headers: RateLimitHeaders) -> None:
         self.session = requests.Session()
+        # Retry idempotent requests that failed with a transient server error.
+        # Rate limit responses (403 and 429) are handled in `api_request()`.
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[500, 502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
+        )
 
         #: The brand name of the git server that provides the REST API.
         self._name: str = "Generic"
@@ -160,11 +175,14 @@ class RestApiClient(ABC):
         self,
         file_filter: FileFilter,
         lines_changed_only: int,
+        keep_names: Optional[Set[str]] = None,
     ) -> List[FileObj]:
         """Fetch a list of the event's changed files.
 
         :param file_filter: A `FileFilter` obj to filter files.
         :param lines_changed_only: A value that dictates what file changes to focus on.
+        :param keep_names: An optional set of file names to keep. Any changed file
+            not in this set is discarded without parsing its changes.
         """
         raise NotImplementedError("must be implemented in the derivative")
 
@@ -15,7 +15,7 @@ from os import environ
 from pathlib import Path
 import urllib.parse
 import sys
-from typing import Dict, List, Any, cast, Optional
+from typing import Dict, List, Any, Set, cast, Optional
 
 from ..common_fs import FileObj, CACHE_PATH
 from ..common_fs.file_filter import FileFilter
@@ -89,6 +89,7 @@ class GithubApiClient(RestApiClient):
         self,
         file_filter: FileFilter,
         lines_changed_only: int,
+        keep_names: Optional[Set[str]] = None,
     ) -> List[FileObj]:
         if environ.get("CI", "false") == "true":
             files_link = f"{self.api_url}/repos/{self.repo}/"
@@ -108,13 +109,19 @@ class GithubApiClient(RestApiClient):
             )
             if response.status_code != 200:
                 return self._get_changed_files_paginated(
-                    files_link, lines_changed_only, file_filter
+                    files_link, lines_changed_only, file_filter, keep_names
                 )
-            return parse_diff(response.text, file_filter, lines_changed_only)
-        return parse_diff(get_diff(), file_filter, lines_changed_only)
+            return parse_diff(
+                response.text, file_filter, lines_changed_only, keep_names
+            )
+        return parse_diff(get_diff(), file_filter, lines_changed_only, keep_names)
 
     def _get_changed_files_paginated(
-        self, url: Optional[str], lines_changed_only: int, file_filter: FileFilter
+        self,
+        url: Optional[str],
+        lines_changed_only: int,
+        file_filter: FileFilter,
+        keep_names: Optional[Set[str]] = None,
     ) -> List[FileObj]:
         """A fallback implementation of getting file changes using a paginated
         REST API endpoint."""
@@ -143,6 +150,8 @@ class GithubApiClient(RestApiClient):
                         f"Missing 'filename' key in file:\n{json.dumps(file, indent=2)}"
                     )
                     raise exc
+                if keep_names is not None and file_name not in keep_names:
+                    continue
                 if not file_filter.is_source_or_ignored(file_name):
                     continue
                 if lines_changed_only > 0 and cast(int, file.get("changes", 0)) == 0:
@@ -298,32 +307,29 @@ class GithubApiClient(RestApiClient):
             if not file_obj.format_advice:
                 continue
             if file_obj.format_advice.replaced_lines:
-                line_list = []
-                for fix in file_obj.format_advice.replaced_lines:
-                    line_list.append(str(fix.line))
-                output = "::notice file="
+                lines = ", ".join(
+                    str(fix.line) for fix in file_obj.format_advice.replaced_lines
+                )
                 name = file_obj.name
-                output += f"{name},title=Run clang-format on {name}::File {name}"
-                output += f" does not conform to {style_guide} style guidelines. "
-                output += "(lines {lines})".format(lines=", ".join(line_list))
-                log_commander.info(output)
+                log_commander.info(
+                    f"::notice file={name},title=Run clang-format on {name}::File "
+                    f"{name} does not conform to {style_guide} style guidelines. "
+                    f"(lines {lines})"
+                )
         for file_obj in files:
             if not file_obj.tidy_advice:
                 continue
+            name = file_obj.name
             for note in file_obj.tidy_advice.notes:
-                if note.filename == file_obj.name:
-                    output = "::{} ".format(
+                if note.filename == name:
+                    kind = (
                         "notice" if note.severity.startswith("note") else note.severity
                     )
-                    output += "file={file},line={line},title={file}:{line}:".format(
-                        file=file_obj.name, line=note.line
-                    )
-                    output += "{cols} [{diag}]::{info}".format(
-                        cols=note.cols,
-                        diag=note.diagnostic,
-                        info=note.rationale,
+                    log_commander.info(
+                        f"::{kind} file={name},line={note.line},"
+                        f"title={name}:{note.line}:{note.cols} [{note.diagnostic}]::"
+                        f"{note.rationale}"
                     )
-                    log_commander.info(output)
 
     def update_comment(
         self,
@@ -380,7 +386,7 @@ class GithubApiClient(RestApiClient):
             page += 1
 
             comments = cast(List[Dict[str, Any]], response.json())
-            if logger.level >= logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 json_comments = Path(f"{CACHE_PATH}/comments-pg{page}.json")
                 json_comments.write_text(
                     json.dumps(comments, indent=2), encoding="utf-8"
@@ -227,6 +227,7 @@ REQUIRED_VERSIONS = {
     "1.8.1": ["jobs"],
     "1.9.0": ["ignore_tidy", "ignore_format"],
     "1.10.0": ["passive_reviews"],
+    "1.11.0": ["cache_advice"],
 }
 
 PERMISSIONS = {
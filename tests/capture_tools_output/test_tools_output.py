@@ -504,3 +504,42 @@ def test_tidy_extra_args(
         user_input = user_input[0].split()
     for a in user_input:
         assert f"--extra-arg={a}" in matched_args
+
+
+def test_cached_tool_output(
+    capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    """Verify that clang tools' output is reused from the cache (when enabled)."""
+    shutil.copytree(str(Path(__file__).parent.parent / "demo"), str(tmp_path / "demo"))
+    monkeypatch.chdir(str(tmp_path))
+    monkeypatch.setenv("CPP_LINTER_PYTEST_NO_RICH", "1")
+    logger.setLevel(logging.INFO)
+    args = get_cli_parser().parse_args(
+        [
+            f"--version={CLANG_VERSION}",
+            "--lines-changed-only=false",
+            "--extension=cpp,hpp",
+            "--tidy-review=true",
+            "--format-review=true",
+            "--cache-advice=true",
+        ],
+        namespace=Args(),
+    )
+    results = []
+    for _ in range(2):
+        files = [FileObj("demo/demo.cpp")]
+        capture_clang_tools_output(files=files, args=args)
+        results.append(files[0])
+    stdout = capsys.readouterr().out
+    assert stdout.count("Using cached output of") == 2  # 1 for each tool
+    fresh, cached = results
+    assert fresh.tidy_advice is not None and cached.tidy_advice is not None
+    assert len(fresh.tidy_advice.notes) == len(cached.tidy_advice.notes)
+    assert fresh.tidy_advice.patched == cached.tidy_advice.patched
+    assert fresh.format_advice is not None and cached.format_advice is not None
+    assert len(fresh.format_advice.replaced_lines) == len(
+        cached.format_advice.replaced_lines
+    )
+    assert fresh.format_advice.patched == cached.format_advice.patched
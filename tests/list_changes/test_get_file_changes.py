@@ -1,6 +1,7 @@
 import json
 import logging
 from pathlib import Path
+from typing import Optional, Set
 import pytest
 import requests_mock
 from cpp_linter import GithubApiClient, logger, FileFilter
@@ -73,6 +74,9 @@ TEST_DIFF = (TEST_ASSETS / "patch.diff").read_text(encoding="utf-8")
         "local_dev",
     ],
 )
+@pytest.mark.parametrize(
+    "keep_names", [None, {"src/demo.cpp"}], ids=["all_names", "keep_names"]
+)
 def test_get_changed_files(
     caplog: pytest.LogCaptureFixture,
     monkeypatch: pytest.MonkeyPatch,
@@ -81,6 +85,7 @@ def test_get_changed_files(
     paginated: bool,
     fake_runner: bool,
     lines_changed_only: int,
+    keep_names: Optional[Set[str]],
 ):
     """test getting a list of changed files for an event."""
     caplog.set_level(logging.DEBUG, logger=logger.name)
@@ -142,9 +147,14 @@ def test_get_changed_files(
                 )
 
         files = gh_client.get_list_of_changed_files(
-            FileFilter(extensions=["cpp", "hpp"]), lines_changed_only=lines_changed_only
+            FileFilter(extensions=["cpp", "hpp"]),
+            lines_changed_only=lines_changed_only,
+            keep_names=keep_names,
         )
         assert files
+        if keep_names is not None:
+            # any other changed files are skipped
+            assert [file.name for file in files] == list(keep_names)
         for file in files:
             expected = ["src/demo.cpp", "src/demo.hpp"]
             if lines_changed_only == 0:
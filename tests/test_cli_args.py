@@ -36,6 +36,7 @@ from cpp_linter.cli import get_cli_parser, Args
         ("jobs", "4", "jobs", 4),
         pytest.param("jobs", "x", "jobs", 0, marks=pytest.mark.xfail),
         ("ignore-tidy", "!src|", "ignore_tidy", "!src|"),
+        ("cache-advice", "true", "cache_advice", True),
     ],
 )
 def test_arg_parser(
@@ -105,3 +105,14 @@ def test_terse_hunk_header():
     git_files = parse_diff(diff_str, file_filter, 0)
     assert git_files
     assert files[0].diff_chunks == git_files[0].diff_chunks
+
+
+@pytest.mark.parametrize(
+    "keep_names", [{"path/to/Some file.cpp"}, set()], ids=["kept", "skipped"]
+)
+def test_keep_names(keep_names: set):
+    """Only the files in ``keep_names`` are parsed from the diff."""
+    file_filter = FileFilter(extensions=["cpp"])
+    from_c = parse_diff(TYPICAL_DIFF, file_filter, 0, keep_names)
+    from_py = parse_diff_str(TYPICAL_DIFF, file_filter, 0, keep_names)
+    assert [f.name for f in from_c] == [f.name for f in from_py] == list(keep_names)
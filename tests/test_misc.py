@@ -1,25 +1,41 @@
 """Tests that complete coverage that aren't prone to failure."""
 
+import io
 import logging
 import os
 import json
 from pathlib import Path
 import shutil
+import sys
 from typing import List, cast
 
 import pytest
 
-from cpp_linter.common_fs import get_line_cnt_from_cols, FileObj
+import cpp_linter.common_fs
+from cpp_linter.common_fs import (
+    get_line_cnt_from_cols,
+    FileObj,
+    get_cache_key,
+    read_cache,
+    write_cache,
+)
 from cpp_linter.common_fs.file_filter import FileFilter
 from cpp_linter.clang_tools import assemble_version_exec
+from cpp_linter.clang_tools.patcher import ReviewComments, Suggestion
 from cpp_linter.loggers import (
     logger,
     log_commander,
     start_log_group,
     end_log_group,
+    worker_log_init,
+    restore_logger_config,
 )
 from cpp_linter.rest_api.github_api import GithubApiClient
-from cpp_linter.clang_tools.clang_tidy import TidyNotification
+from cpp_linter.clang_tools.clang_tidy import (
+    TidyNotification,
+    index_compilation_database,
+    parse_tidy_output,
+)
 
 
 def test_exit_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
@@ -81,6 +97,24 @@ def test_list_src_files(
         assert Path(file.name).suffix.lstrip(".") in extensions
 
 
+def test_list_src_files_walk(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Hidden and unreadable directories are skipped when listing source files."""
+    for name in ("src/a.cpp", ".hidden/b.cpp", "locked/c.cpp", "src/d.txt"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("")
+    monkeypatch.chdir(str(tmp_path))
+    scandir = os.scandir
+
+    def mock_scandir(path: str):
+        if path == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", mock_scandir)
+    files = FileFilter(extensions=["cpp"]).list_source_files()
+    assert [f.name for f in files] == ["src/a.cpp"]
+
+
 @pytest.mark.parametrize("line,cols,offset", [(13, 5, 144), (19, 1, 189)])
 def test_file_offset_translation(line: int, cols: int, offset: int):
     """Validate output from ``get_line_cnt_from_cols()``"""
@@ -147,3 +181,94 @@ def test_clang_analyzer_link():
             diagnostic_name.split("-", maxsplit=2)[2],
         )
     )
+
+
+def test_tidy_note_path_in_cwd(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Only a leading working directory is removed from a note's absolute path."""
+    cwd = tmp_path.resolve() / "repo"
+    cwd.mkdir()
+    monkeypatch.chdir(str(cwd))
+    # an absolute path that contains the working directory (but not as a prefix)
+    other = f"{tmp_path.resolve().as_posix()}/mirror{cwd.as_posix()}/src/demo.cpp"
+    tidy_out = "\n".join(
+        [
+            f"{cwd.as_posix()}/src/demo.cpp:3:1: warning: rationale [some-check]",
+            f"{other}:3:1: warning: rationale [some-check]",
+        ]
+    )
+    advice = parse_tidy_output(tidy_out, database=None)
+    assert [note.filename for note in advice.notes] == ["src/demo.cpp", other]
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["list", "dict"])
+def test_tidy_note_database(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, indexed: bool
+):
+    """A note's relative path is resolved with the compilation database, whether it
+    is the deserialized JSON or the index from ``index_compilation_database()``."""
+    monkeypatch.chdir(str(tmp_path))
+    db_json = [{"file": "../demo.cpp", "directory": f"{tmp_path.as_posix()}/build"}]
+    note = TidyNotification(
+        ("../demo.cpp", 3, 1, "warning", "rationale", "some-check"),
+        database=index_compilation_database(db_json) if indexed else db_json,
+    )
+    assert note.filename == "demo.cpp"
+
+
+def test_cache_write_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """A failure to write the cache should not raise or leave a temporary file."""
+    monkeypatch.setattr(cpp_linter.common_fs, "CACHE_PATH", tmp_path)
+    key = get_cache_key("1.2.3", "clang-tidy", b"contents")
+    write_cache("clang-tidy", key, b"output")
+    assert read_cache("clang-tidy", key) == b"output"
+
+    # a directory in place of the cached file prevents replacing it
+    key = get_cache_key("1.2.3", "clang-format", b"contents")
+    cache_file = tmp_path / "clang-format" / key[:2] / key
+    cache_file.mkdir(parents=True)
+    write_cache("clang-format", key, b"output")
+    assert read_cache("clang-format", key) is None
+    assert [p.name for p in cache_file.parent.iterdir()] == [key]
+
+
+def test_merge_similar_suggestion():
+    """Suggestions for the same lines of a file are merged into the first one."""
+    review_comments = ReviewComments()
+    for file_name, line, comment in (
+        ("a.cpp", 3, "first"),
+        ("a.cpp", 3, "second"),
+        ("a.cpp", 4, "other line"),
+        ("b.cpp", 3, "other file"),
+    ):
+        suggestion = Suggestion(file_name)
+        suggestion.line_end = line
+        suggestion.comment = comment
+        if not review_comments.merge_similar_suggestion(suggestion):
+            review_comments.add_suggestion(suggestion)
+    assert [s.comment for s in review_comments.suggestions] == [
+        "first\nsecond",
+        "other line",
+        "other file",
+    ]
+
+
+def test_worker_log_init_in_process(monkeypatch: pytest.MonkeyPatch):
+    """Logs are only captured while the clang tools run in the main process. The
+    global rich console is neither redirected nor pinned to a stream."""
+    pytest.importorskip("rich")
+    from rich import get_console
+    from rich.logging import RichHandler
+
+    monkeypatch.delenv("CPP_LINTER_PYTEST_NO_RICH", raising=False)
+    monkeypatch.setattr(logger, "handlers", [RichHandler(console=get_console())])
+    with restore_logger_config():
+        log_stream = worker_log_init(logging.INFO)
+        logger.warning("captured message")
+    assert "captured message" in log_stream.getvalue()
+
+    # the global console should write to whatever stream is currently stdout
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    logger.warning("restored message")
+    assert "restored message" in stdout.getvalue()
+    assert "captured message" not in stdout.getvalue()